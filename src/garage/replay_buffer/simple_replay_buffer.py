@@ -16,21 +16,16 @@ class SimpleReplayBuffer(ReplayBuffer):
     def sample(self, batch_size):
         """Sample a transition of batch_size."""
         assert self._n_transitions_stored >= batch_size
-        buffer = {}
-        for key in self._buffer.keys():
-            buffer[key] = self._buffer[key][:self._current_size]
-
-        # Select which episodes to use
-        time_horizon = buffer['action'].shape[1]
-        rollout_batch_size = buffer['action'].shape[0]
-        episode_idxs = np.random.randint(rollout_batch_size, size=batch_size)
-        # Select time steps to use
-        t_samples = np.random.randint(time_horizon, size=batch_size)
+        # Select which episodes and time steps to use
+        episode_idxs = np.random.randint(self._current_size, size=batch_size)
+        t_samples = np.random.randint(self._time_horizon, size=batch_size)
 
+        # Indexing with the (episode, time step) pairs gathers each entry
+        # into a (batch_size, ...) array in a single pass over the storage,
+        # without slicing out intermediate per-key views first.
         transitions = {}
-        for key in buffer.keys():
-            samples = buffer[key][episode_idxs, t_samples]
-            transitions[key] = samples.reshape(batch_size, *samples.shape[1:])
+        for key, buf in self._buffer.items():
+            transitions[key] = buf[episode_idxs, t_samples]
 
         assert (transitions['action'].shape[0] == batch_size)
         return transitions
@@ -139,13 +139,18 @@ class TD3(DDPG):
                 inputs=[self.target_policy.model.networks['default'].input],
                 outputs=self.target_policy.model.networks['default'].outputs)
 
-            self.target_qf_f_prob_online = tensor_utils.compile_function(
-                inputs=self.target_qf.model.networks['default'].inputs,
-                outputs=self.target_qf.model.networks['default'].outputs)
-
-            self.target_qf2_f_prob_online = tensor_utils.compile_function(
-                inputs=self.target_qf2.model.networks['default'].inputs,
-                outputs=self.target_qf2.model.networks['default'].outputs)
+            # Both target critics are evaluated over the same batch, so
+            # compile them into one function and run them in a single
+            # session call.
+            self.target_qfs_f_prob_online = tensor_utils.compile_function(
+                inputs=(list(self.target_qf.model.networks['default'].inputs)
+                        +
+                        list(self.target_qf2.model.networks['default'].inputs)
+                        ),
+                outputs=[
+                    self.target_qf.model.networks['default'].outputs,
+                    self.target_qf2.model.networks['default'].outputs
+                ])
 
             # Set up target init and update functions
             with tf.name_scope('setup_target'):
@@ -214,28 +219,28 @@ class TD3(DDPG):
                     self.qf_lr, name='QFunctionOptimizer').minimize(
                         qval2_loss, var_list=self.qf2.get_trainable_vars())
 
-            f_train_qf = tensor_utils.compile_function(
-                inputs=[y, obs, actions],
-                outputs=[qf_train_op, qval1_loss, qval])
-            f_train_qf2 = tensor_utils.compile_function(
+            # Train both critics in one session call; their train ops are
+            # independent, so fusing them halves the per-step dispatch and
+            # feed transfers.
+            f_train_qfs = tensor_utils.compile_function(
                 inputs=[y, obs, actions],
-                outputs=[qf2_train_op, qval2_loss, q2val])
+                outputs=[
+                    qf_train_op, qf2_train_op, qval1_loss, qval2_loss, qval,
+                    q2val
+                ])
 
             self.f_train_policy = f_train_policy
-            self.f_train_qf = f_train_qf
+            self.f_train_qfs = f_train_qfs
             self.f_init_target = f_init_target
             self.f_update_target = f_update_target
-            self.f_train_qf2 = f_train_qf2
 
     def __getstate__(self):
         """Object.__getstate__."""
         data = self.__dict__.copy()
         del data['target_policy_f_prob_online']
-        del data['target_qf_f_prob_online']
-        del data['target_qf2_f_prob_online']
+        del data['target_qfs_f_prob_online']
         del data['f_train_policy']
-        del data['f_train_qf']
-        del data['f_train_qf2']
+        del data['f_train_qfs']
         del data['f_init_target']
         del data['f_update_target']
         return data
@@ -286,16 +291,14 @@ class TD3(DDPG):
                         self._action_noise_clip)
         target_actions += noise
 
-        target_qvals = self.target_qf_f_prob_online(next_inputs,
-                                                    target_actions)
-        target_q2vals = self.target_qf2_f_prob_online(next_inputs,
-                                                      target_actions)
+        target_qvals, target_q2vals = self.target_qfs_f_prob_online(
+            next_inputs, target_actions, next_inputs, target_actions)
         target_qvals = np.minimum(target_qvals, target_q2vals)
         ys = (self.reward_scale * rewards +
               (1.0 - terminals) * self.discount * target_qvals)
 
-        _, qval_loss, qval = self.f_train_qf(ys, inputs, actions)
-        _, q2val_loss, q2val = self.f_train_qf2(ys, inputs, actions)
+        _, _, qval_loss, q2val_loss, qval, q2val = self.f_train_qfs(
+            ys, inputs, actions)
 
         if qval_loss > q2val_loss:
             qval_loss = q2val_loss
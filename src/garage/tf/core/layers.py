@@ -732,12 +732,8 @@ class SpatialExpectedSoftmaxLayer(Layer):
         # return tf.reshape(
         #     tf.concat(2, vals), [-1, input.get_shape()[-1].value * 2])
 
-        # import ipdb; ipdb.set_trace()
-
         # input.get_shape()
         # exp / tf.reduce_sum(exp, reduction_indices=[1, 2], keep_dims=True)
-        # import ipdb;
-        # ipdb.set_trace()
         # spatial softmax?
 
         # for dim in range(2):
@@ -951,7 +947,6 @@ class SliceLayer(Layer):
                     input, [self.axis + 1
                             ])[(slice(None), ) * axis + (-1 - self.slice, ) +
                                (slice(None), ) * (ndims - axis - 1)]
-            # import ipdb; ipdb.set_trace()
             return input[(slice(None), ) * axis + (self.slice, ) +
                          (slice(None), ) * (ndims - axis - 1)]
 
@@ -5,9 +5,38 @@ import copy
 from dowel import logger, tabular
 import numpy as np
 import torch
+import torch.nn.functional as F
 
 from garage.np.algos.off_policy_rl_algorithm import OffPolicyRLAlgorithm
-from garage.torch.utils import np_to_torch, torch_to_np
+from garage.torch.utils import global_device, np_to_torch, torch_to_np
+from garage.torch.utils import zero_optim_grads
+
+
+def _make_optimizer(optimizer, parameters, lr):
+    """Construct an optimizer, preferring the fused Adam kernel.
+
+    Recent versions of torch.optim.Adam accept fused=True on CUDA,
+    which updates all parameters with a single fused kernel instead of
+    one launch per tensor. Fall back to a plain construction when the
+    optimizer does not support it (e.g. torch==1.1.0) or the
+    parameters do not live on a CUDA device.
+
+    Args:
+        optimizer (type): Optimizer class from torch.optim.
+        parameters (iterable): Parameters to optimize.
+        lr (float): Learning rate.
+
+    Returns:
+        torch.optim.Optimizer: The constructed optimizer.
+
+    """
+    parameters = list(parameters)
+    if optimizer is torch.optim.Adam and torch.cuda.is_available():
+        try:
+            return optimizer(parameters, lr=lr, fused=True)
+        except (TypeError, RuntimeError):
+            pass
+    return optimizer(parameters, lr=lr)
 
 
 class DDPG(OffPolicyRLAlgorithm):
@@ -93,6 +122,7 @@ class DDPG(OffPolicyRLAlgorithm):
 
         self.success_history = deque(maxlen=100)
         self.episode_rewards = []
+        self._episode_reward_sum = 0.
         self.episode_policy_losses = []
         self.episode_qf_losses = []
         self.epoch_ys = []
@@ -114,11 +144,23 @@ class DDPG(OffPolicyRLAlgorithm):
                          reward_scale=reward_scale,
                          smooth_return=smooth_return)
 
+        # Resolve the compute device once and keep every network on it, so
+        # no forward pass triggers an implicit cross-device transfer.
+        self._device = global_device()
+        self.policy.to(self._device)
+        self.qf.to(self._device)
         self.target_policy = copy.deepcopy(self.policy)
         self.target_qf = copy.deepcopy(self.qf)
-        self.policy_optimizer = optimizer(self.policy.parameters(),
-                                          lr=self.policy_lr)
-        self.qf_optimizer = optimizer(self.qf.parameters(), lr=self.qf_lr)
+        # Target networks are only read from, never trained, so freeze
+        # their parameters to keep autograd from tracking their forwards.
+        for target in (self.target_policy, self.target_qf):
+            for param in target.parameters():
+                param.requires_grad_(False)
+        self.policy_optimizer = _make_optimizer(optimizer,
+                                                self.policy.parameters(),
+                                                self.policy_lr)
+        self.qf_optimizer = _make_optimizer(optimizer, self.qf.parameters(),
+                                            self.qf_lr)
 
     def train_once(self, itr, paths):
         """Perform one iteration of training."""
@@ -126,16 +168,21 @@ class DDPG(OffPolicyRLAlgorithm):
 
         epoch = itr / self.n_epoch_cycles
 
-        self.episode_rewards.extend([
-            path for path, complete in zip(paths['undiscounted_returns'],
-                                           paths['complete']) if complete
-        ])
-        self.success_history.extend([
-            path for path, complete in zip(paths['success_history'],
-                                           paths['complete']) if complete
-        ])
-
-        last_average_return = np.mean(self.episode_rewards)
+        for ret, success, complete in zip(paths['undiscounted_returns'],
+                                          paths['success_history'],
+                                          paths['complete']):
+            if complete:
+                self.episode_rewards.append(ret)
+                self._episode_reward_sum += ret
+                self.success_history.append(success)
+
+        # Maintained as a running sum so the per-iteration average does not
+        # rescan the whole (growing) reward history.
+        if self.episode_rewards:
+            last_average_return = (self._episode_reward_sum /
+                                   len(self.episode_rewards))
+        else:
+            last_average_return = np.nan
         for train_itr in range(self.n_train_steps):
             if self.replay_buffer.n_transitions_stored >= self.min_buffer_size:  # noqa: E501
                 self.evaluate = True
@@ -172,6 +219,7 @@ class DDPG(OffPolicyRLAlgorithm):
 
             if not self.smooth_return:
                 self.episode_rewards = []
+                self._episode_reward_sum = 0.
                 self.episode_policy_losses = []
                 self.episode_qf_losses = []
                 self.epoch_ys = []
@@ -211,21 +259,25 @@ class DDPG(OffPolicyRLAlgorithm):
         clip_range = (-self.clip_return,
                       0. if self.clip_pos_returns else self.clip_return)
 
-        y_target = rewards + (1.0 - terminals) * self.discount * target_qvals
+        # Fused r + discount * (1 - d) * Q'(s', a'), instead of building a
+        # temporary for each arithmetic op in the Bellman target.
+        y_target = torch.addcmul(rewards,
+                                 1.0 - terminals,
+                                 target_qvals,
+                                 value=self.discount)
         y_target = torch.clamp(y_target, clip_range[0], clip_range[1])
 
         # optimize critic
         qval = self.qf(inputs, actions)
-        qf_loss = torch.nn.MSELoss()
-        qval_loss = qf_loss(qval, y_target)
-        self.qf_optimizer.zero_grad()
+        qval_loss = F.mse_loss(qval, y_target)
+        zero_optim_grads(self.qf_optimizer)
         qval_loss.backward()
         self.qf_optimizer.step()
 
         # optimize actor
         actions = self.policy(inputs)
         action_loss = -1 * self.qf(inputs, actions).mean()
-        self.policy_optimizer.zero_grad()
+        zero_optim_grads(self.policy_optimizer)
         action_loss.backward()
         self.policy_optimizer.step()
 
@@ -236,12 +288,16 @@ class DDPG(OffPolicyRLAlgorithm):
 
     def update_target(self):
         """Update parameters in the target policy and Q-value network."""
-        for t_param, param in zip(self.target_qf.parameters(),
-                                  self.qf.parameters()):
-            t_param.data.copy_(t_param.data * (1.0 - self.tau) +
-                               param.data * self.tau)
-
-        for t_param, param in zip(self.target_policy.parameters(),
-                                  self.policy.parameters()):
-            t_param.data.copy_(t_param.data * (1.0 - self.tau) +
-                               param.data * self.tau)
+        with torch.no_grad():
+            for target, source in ((self.target_qf, self.qf),
+                                   (self.target_policy, self.policy)):
+                t_params = [t_param.data for t_param in target.parameters()]
+                params = [param.data for param in source.parameters()]
+                if hasattr(torch, '_foreach_mul_'):
+                    # Single fused multi-tensor kernel per network instead
+                    # of one kernel launch per parameter.
+                    torch._foreach_mul_(t_params, 1.0 - self.tau)
+                    torch._foreach_add_(t_params, params, alpha=self.tau)
+                else:
+                    for t_param, param in zip(t_params, params):
+                        t_param.mul_(1.0 - self.tau).add_(self.tau, param)
@@ -9,6 +9,7 @@ import torch.nn.functional as F
 from garage.misc import special
 from garage.np.algos import BatchPolopt
 from garage.torch.algos import loss_function_utils as loss_utils
+from garage.torch.utils import zero_optim_grads
 
 
 class VPG(BatchPolopt):
@@ -115,7 +116,7 @@ class VPG(BatchPolopt):
         return samples_data['average_return']
 
     def _optimize_policy(self, itr, paths):
-        self.optimizer.zero_grad()
+        zero_optim_grads(self.optimizer)
 
         policy_entropies = torch.stack([
             self._add_padding(
@@ -62,6 +62,7 @@ class MLPModule(nn.Module):
         self._output_nonlinearity = output_nonlinearity
         self._layer_normalization = layer_normalization
         self._layers = nn.ModuleList()
+        self._layer_norms = nn.ModuleList()
 
         prev_size = input_dim
 
@@ -70,6 +71,8 @@ class MLPModule(nn.Module):
             hidden_w_init(layer.weight)
             hidden_b_init(layer.bias)
             self._layers.append(layer)
+            if layer_normalization:
+                self._layer_norms.append(nn.LayerNorm(size))
             prev_size = size
 
         layer = nn.Linear(prev_size, output_dim)
@@ -80,12 +83,12 @@ class MLPModule(nn.Module):
     def forward(self, input_val):
         """Forward method."""
         x = input_val
-        for layer in self._layers[:-1]:
+        for index, layer in enumerate(self._layers[:-1]):
             x = layer(x)
             if self._hidden_nonlinearity is not None:
                 x = self._hidden_nonlinearity(x)
             if self._layer_normalization:
-                x = nn.LayerNorm(x.shape[1])(x)
+                x = self._layer_norms[index](x)
 
         x = self._layers[-1](x)
         if self._output_nonlinearity is not None:
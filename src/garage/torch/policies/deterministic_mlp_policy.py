@@ -8,6 +8,7 @@ import torch
 
 from garage.torch.modules import MLPModule
 from garage.torch.policies import Policy
+from garage.torch.utils import global_device, inference_mode
 
 
 class DeterministicMLPPolicy(MLPModule, Policy):
@@ -37,20 +38,23 @@ class DeterministicMLPPolicy(MLPModule, Policy):
 
     def forward(self, input_val):
         """Forward method."""
-        input_val = torch.FloatTensor(input_val)
+        input_val = torch.as_tensor(input_val,
+                                    dtype=torch.float32,
+                                    device=global_device())
         return super().forward(input_val)
 
     def get_action(self, observation):
         """Return a single action."""
-        with torch.no_grad():
+        with inference_mode():
+            observation = torch.as_tensor(observation, dtype=torch.float32)
             x = self.forward(observation.unsqueeze(0))
-            return x.squeeze(0).numpy(), dict()
+            return x.squeeze(0).cpu().numpy(), dict()
 
     def get_actions(self, observations):
         """Return multiple actions."""
-        with torch.no_grad():
+        with inference_mode():
             x = self.forward(observations)
-            return x.numpy(), dict()
+            return x.cpu().numpy(), dict()
 
     def reset(self, dones=None):
         """Reset policy."""
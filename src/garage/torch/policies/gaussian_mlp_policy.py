@@ -3,6 +3,7 @@ import torch
 
 from garage.torch.modules import GaussianMLPModule
 from garage.torch.policies import Policy
+from garage.torch.utils import global_device, inference_mode
 
 
 class GaussianMLPPolicy(Policy, GaussianMLPModule):
@@ -31,24 +32,27 @@ class GaussianMLPPolicy(Policy, GaussianMLPModule):
 
     def forward(self, inputs):
         """Forward method."""
-        return super().forward(torch.Tensor(inputs))
+        return super().forward(
+            torch.as_tensor(inputs, dtype=torch.float32,
+                            device=global_device()))
 
     def get_action(self, observation):
         """Get a single action given an observation."""
-        with torch.no_grad():
-            observation = observation.unsqueeze(0)
-            dist = self.forward(observation)
-            return (dist.rsample().squeeze(0).numpy(),
-                    dict(mean=dist.mean.squeeze(0).numpy(),
-                         log_std=(dist.variance**.5).log().squeeze(0).numpy()))
+        with inference_mode():
+            observation = torch.as_tensor(observation, dtype=torch.float32)
+            dist = self.forward(observation.unsqueeze(0))
+            return (dist.rsample().squeeze(0).cpu().numpy(),
+                    dict(mean=dist.mean.squeeze(0).cpu().numpy(),
+                         log_std=(dist.variance**.5).log().squeeze(
+                             0).cpu().numpy()))
 
     def get_actions(self, observations):
         """Get actions given observations."""
-        with torch.no_grad():
+        with inference_mode():
             dist = self.forward(observations)
-            return (dist.rsample().numpy(),
-                    dict(mean=dist.mean.numpy(),
-                         log_std=(dist.variance**.5).log().numpy()))
+            return (dist.rsample().cpu().numpy(),
+                    dict(mean=dist.mean.cpu().numpy(),
+                         log_std=(dist.variance**.5).log().cpu().numpy()))
 
     def log_likelihood(self, observation, action):
         """Get log likelihood given observations and action."""
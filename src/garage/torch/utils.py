@@ -1,11 +1,63 @@
 """Utility functions for PyTorch."""
 import torch
 
+_DEVICE = None
+
+
+def set_gpu_mode(mode, gpu_id=0):
+    """
+    Set whether GPU or CPU should be used for PyTorch computation.
+
+     Args:
+        mode (bool): Whether to place tensors and modules on the GPU.
+        gpu_id (int): Which GPU to use, if mode is True.
+
+    """
+    global _DEVICE
+    _DEVICE = torch.device(('cuda:' + str(gpu_id)) if mode else 'cpu')
+
+
+def global_device():
+    """
+    Return the device PyTorch computation should run on.
+
+    The device is cached so callers in hot loops do not re-resolve it.
+    Defaults to the CPU until set_gpu_mode enables a GPU.
+
+    Returns:
+       torch.device: Device to place tensors and modules on.
+
+    """
+    if _DEVICE is None:
+        set_gpu_mode(False)
+    return _DEVICE
+
+
+def inference_mode():
+    """
+    Return a context manager that disables autograd tracking.
+
+    Uses torch.inference_mode where available, which also skips view and
+    version-counter bookkeeping on every tensor produced inside the
+    block, and falls back to torch.no_grad on builds that predate it
+    (such as the pinned torch==1.1.0). Tensors produced under
+    inference_mode must not be reused inside a graph that requires
+    gradients, so only use this on pure inference paths.
+
+    Returns:
+       Context manager disabling autograd tracking.
+
+    """
+    return getattr(torch, 'inference_mode', torch.no_grad)()
+
 
 def np_to_torch(array_dict):
     """
     Convert numpy arrays to PyTorch tensors.
 
+    Tensors are placed on the global device. Transfers to the GPU are
+    staged through pinned memory so the copy does not block the host.
+
      Args:
         dict (dict): Dictionary of data in numpy arrays.
 
@@ -13,11 +65,32 @@ def np_to_torch(array_dict):
        Dictionary of data in PyTorch tensors.
 
     """
+    device = global_device()
     for key, value in array_dict.items():
-        array_dict[key] = torch.FloatTensor(value)
+        tensor = torch.as_tensor(value, dtype=torch.float32)
+        if device.type == 'cuda':
+            tensor = tensor.pin_memory().to(device, non_blocking=True)
+        array_dict[key] = tensor
     return array_dict
 
 
+def zero_optim_grads(optim):
+    """
+    Set the gradients of all optimized tensors to None.
+
+    Unlike ``optim.zero_grad()``, which writes zeros into every gradient
+    buffer, dropping the buffers skips a full memset over the parameters
+    on each training step; ``backward`` re-allocates them as needed.
+
+     Args:
+        optim (torch.optim.Optimizer): Optimizer whose gradients to clear.
+
+    """
+    for group in optim.param_groups:
+        for param in group['params']:
+            param.grad = None
+
+
 def torch_to_np(value_in):
     """
     Convert PyTorch tensors to numpy arrays.
@@ -31,5 +104,5 @@ def torch_to_np(value_in):
     """
     value_out = []
     for v in value_in:
-        value_out.append(v.numpy())
+        value_out.append(v.cpu().numpy())
     return tuple(value_out)